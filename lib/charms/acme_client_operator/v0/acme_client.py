@@ -60,11 +60,11 @@ provides:
 ```
 """
 import abc
+import base64
 import logging
 import re
 from abc import abstractmethod
-from typing import Dict, List, Optional, Union
-from urllib.parse import urlparse
+from typing import Dict, List, Optional, Tuple, Union
 
 from charms.tls_certificates_interface.v1.tls_certificates import (  # type: ignore[import]
     CertificateCreationRequestEvent,
@@ -89,6 +89,91 @@ LIBPATCH = 3
 
 logger = logging.getLogger(__name__)
 
+_CSR_PEM_RE = re.compile(
+    r"-----BEGIN CERTIFICATE REQUEST-----(.*?)-----END CERTIFICATE REQUEST-----", re.DOTALL
+)
+
+_CERT_PEM_RE = re.compile(
+    r"-----BEGIN CERTIFICATE-----.*?-----END CERTIFICATE-----", re.DOTALL
+)
+
+# DER encoding of the id-at-commonName attribute type (OID 2.5.4.3).
+_COMMON_NAME_OID_DER = b"\x06\x03\x55\x04\x03"
+
+
+def _der_read_header(der: bytes, offset: int) -> Optional[Tuple[int, int, int]]:
+    """Reads the tag-length header of the DER element at the given offset.
+
+    Returns:
+        Optional[Tuple[int, int, int]]: Tag, content start and content end
+        offsets, or None when the header is truncated or malformed.
+    """
+    if offset + 2 > len(der):
+        return None
+    tag = der[offset]
+    length = der[offset + 1]
+    offset += 2
+    if length & 0x80:
+        num_length_bytes = length & 0x7F
+        if num_length_bytes == 0 or offset + num_length_bytes > len(der):
+            return None
+        length = int.from_bytes(der[offset : offset + num_length_bytes], "big")
+        offset += num_length_bytes
+    if offset + length > len(der):
+        return None
+    return tag, offset, offset + length
+
+
+def _common_name_from_csr_der(der: bytes) -> Optional[str]:
+    """Extracts the subject common name from a DER encoded CSR without full X.509 parsing.
+
+    Walks CertificationRequest -> certificationRequestInfo -> version -> subject,
+    then iterates the subject's relative distinguished names comparing each
+    attribute type against id-at-commonName. Only structurally-positioned OIDs
+    are compared, so OID bytes embedded in another attribute's string value can
+    never be mistaken for the common name.
+
+    Returns:
+        Optional[str]: Common name, or None when the fast path does not apply.
+    """
+    certification_request = _der_read_header(der, 0)
+    if not certification_request or certification_request[0] != 0x30:  # SEQUENCE
+        return None
+    request_info = _der_read_header(der, certification_request[1])
+    if not request_info or request_info[0] != 0x30:  # SEQUENCE
+        return None
+    version = _der_read_header(der, request_info[1])
+    if not version or version[0] != 0x02:  # INTEGER
+        return None
+    subject = _der_read_header(der, version[2])
+    if not subject or subject[0] != 0x30:  # SEQUENCE OF RDN
+        return None
+    rdn_offset = subject[1]
+    while rdn_offset < subject[2]:
+        rdn = _der_read_header(der, rdn_offset)
+        if not rdn or rdn[0] != 0x31:  # SET OF AttributeTypeAndValue
+            return None
+        attribute_offset = rdn[1]
+        while attribute_offset < rdn[2]:
+            attribute = _der_read_header(der, attribute_offset)
+            if not attribute or attribute[0] != 0x30:  # SEQUENCE
+                return None
+            attribute_type = _der_read_header(der, attribute[1])
+            if not attribute_type or attribute_type[0] != 0x06:  # OBJECT IDENTIFIER
+                return None
+            if der[attribute[1] : attribute_type[2]] == _COMMON_NAME_OID_DER:
+                value = _der_read_header(der, attribute_type[2])
+                # UTF8String, PrintableString, TeletexString or IA5String.
+                if not value or value[0] not in (0x0C, 0x13, 0x14, 0x16):
+                    return None
+                try:
+                    return der[value[1] : value[2]].decode()
+                except UnicodeDecodeError:
+                    return None
+            attribute_offset = attribute[2]
+        rdn_offset = rdn[2]
+    return None
+
 
 class AcmeClient(CharmBase):
     """Base charm for charms that use the ACME protocol to get certificates.
@@ -100,9 +185,9 @@ class AcmeClient(CharmBase):
 
     def __init__(self, *args, plugin: str):
         super().__init__(*args)
-        self._csr_path = "/tmp/csr.pem"
+        self._csr_path = "/dev/stdin"
         self._certs_path = "/tmp/.lego/certificates/"
-        self._container_name = list(self.meta.containers.values())[0].name
+        self._container_name = next(iter(self.meta.containers.values())).name
         self._container = self.unit.get_container(self._container_name)
         self.tls_certificates = TLSCertificatesProvidesV1(self, "certificates")
         self.framework.observe(
@@ -110,9 +195,19 @@ class AcmeClient(CharmBase):
             self._on_certificate_creation_request,
         )
         self._plugin = plugin
+        self._cmd_cache: Optional[List[str]] = None
+        self._cmd_cache_key: Optional[Tuple[str, str, str]] = None
+        self._valid_generic_config_key: Optional[Tuple[Optional[str], Optional[str]]] = None
 
     def validate_generic_acme_config(self) -> bool:
-        """Validates generic ACME config."""
+        """Validates generic ACME config.
+
+        The result is cached while the email and server config are unchanged,
+        so bulk certificate requests only pay for validation once.
+        """
+        key = (self._email, self._server)
+        if key == self._valid_generic_config_key:
+            return True
         if not self._email:
             self.unit.status = BlockedStatus("Email address was not provided")
             return False
@@ -125,6 +220,7 @@ class AcmeClient(CharmBase):
         if not self._server_is_valid(self._server):
             self.unit.status = BlockedStatus("Invalid ACME server")
             return False
+        self._valid_generic_config_key = key
         return True
 
     @abstractmethod
@@ -150,6 +246,15 @@ class AcmeClient(CharmBase):
     @staticmethod
     def _get_subject_from_csr(certificate_signing_request: str) -> str:
         """Returns subject from a provided CSR."""
+        pem_body = _CSR_PEM_RE.search(certificate_signing_request)
+        if pem_body:
+            try:
+                der = base64.b64decode(pem_body.group(1))
+            except ValueError:
+                der = b""
+            common_name = _common_name_from_csr_der(der)
+            if common_name is not None:
+                return common_name
         csr = x509.load_pem_x509_csr(certificate_signing_request.encode())
         subject_value = csr.subject.get_attributes_for_oid(NameOID.COMMON_NAME)[0].value
         if isinstance(subject_value, bytes):
@@ -157,18 +262,19 @@ class AcmeClient(CharmBase):
         else:
             return subject_value
 
-    def _push_csr_to_workload(self, csr: str) -> None:
-        """Pushes CSR to workload container."""
-        self._container.push(path=self._csr_path, make_dirs=True, source=csr.encode())
-
-    def _execute_lego_cmd(self) -> bool:
-        """Executes lego command in workload container."""
+    def _execute_lego_cmd(self, csr: str) -> bool:
+        """Executes lego command in workload container, streaming the CSR over stdin."""
         process = self._container.exec(
-            self._cmd, timeout=300, working_dir="/tmp", environment=self._plugin_config
+            self._cmd,
+            timeout=300,
+            working_dir="/tmp",
+            environment=self._plugin_config,
+            stdin=csr,
         )
         try:
             stdout, error = process.wait_output()
-            logger.info(f"Return message: {stdout}, {error}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Return message: {stdout}, {error}")
         except ExecError as e:
             logger.error("Exited with code %d. Stderr:", e.exit_code)
             for line in e.stderr.splitlines():  # type: ignore
@@ -179,14 +285,13 @@ class AcmeClient(CharmBase):
     def _pull_certificates_from_workload(self, csr_subject: str) -> List[Union[bytes, str]]:
         """Pulls certificates from workload container."""
         chain_pem = self._container.pull(path=f"{self._certs_path}{csr_subject}.crt")
-        return [cert for cert in chain_pem.read().split("\n\n")]  # type: ignore[arg-type]
+        return _CERT_PEM_RE.findall(chain_pem.read())  # type: ignore[arg-type]
 
     def _on_certificate_creation_request(self, event: CertificateCreationRequestEvent) -> None:
         """Handles certificate creation request event.
 
         - Retrieves subject from CSR
-        - Pushes CSR to workload container
-        - Executes lego command in workload
+        - Executes lego command in workload, streaming the CSR over stdin
         - Pulls certificates from workload
         - Sends certificates to requesting charm
         """
@@ -207,9 +312,8 @@ class AcmeClient(CharmBase):
             )
             return
         logger.info("Received Certificate Creation Request for domain %s", csr_subject)
-        self._push_csr_to_workload(event.certificate_signing_request)
         self.unit.status = MaintenanceStatus("Executing lego command")
-        if not self._execute_lego_cmd():
+        if not self._execute_lego_cmd(event.certificate_signing_request):
             self.unit.status = BlockedStatus(
                 "Workload command execution failed, use `juju debug-log` for more information."
             )
@@ -219,7 +323,7 @@ class AcmeClient(CharmBase):
             certificate=signed_certificates[0],
             certificate_signing_request=event.certificate_signing_request,
             ca=signed_certificates[-1],
-            chain=list(reversed(signed_certificates)),
+            chain=signed_certificates[::-1],
             relation_id=event.relation_id,
         )
         self.unit.status = ActiveStatus()
@@ -235,19 +339,23 @@ class AcmeClient(CharmBase):
             raise ValueError("Email address was not provided")
         if not self._server:
             raise ValueError("ACME server was not provided")
-        return [
-            "lego",
-            "--email",
-            self._email,
-            "--accept-tos",
-            "--csr",
-            self._csr_path,
-            "--server",
-            self._server,
-            "--dns",
-            self._plugin,
-            "run",
-        ]
+        cmd_key = (self._email, self._server, self._plugin)
+        if self._cmd_cache is None or self._cmd_cache_key != cmd_key:
+            self._cmd_cache = [
+                "lego",
+                "--email",
+                self._email,
+                "--accept-tos",
+                "--csr",
+                self._csr_path,
+                "--server",
+                self._server,
+                "--dns",
+                self._plugin,
+                "run",
+            ]
+            self._cmd_cache_key = cmd_key
+        return self._cmd_cache
 
     @property
     @abstractmethod
@@ -264,17 +372,20 @@ class AcmeClient(CharmBase):
     @staticmethod
     def _email_is_valid(email: str) -> bool:
         """Validate the format of the email address."""
-        if not re.match(r"[^@]+@[^@]+\.[^@]+", email):
+        at = email.find("@")
+        if at < 1 or email.find("@", at + 1) != -1:
             return False
-        return True
+        domain = email[at + 1 :]
+        dot = domain.find(".", 1)
+        return 0 < dot < len(domain) - 1
 
     @staticmethod
     def _server_is_valid(server: str) -> bool:
         """Validate the format of the ACME server address."""
-        urlparts = urlparse(server)
-        if not all([urlparts.scheme, urlparts.netloc]):
+        if not server.startswith(("https://", "http://")):
             return False
-        return True
+        host = server.split("://", 1)[1]
+        return bool(host) and not host.startswith("/")
 
     @property
     def _email(self) -> Optional[str]:
@@ -60,8 +60,9 @@ class GandiLiveDNSVersion5AcmeOperatorCharm(AcmeClient):
         return additional_config
 
     def _validate_gandi_livedns_config(self) -> bool:
+        plugin_config = self._plugin_config
         if missing_config := [
-            option for option in self.REQUIRED_CONFIG if not self._plugin_config[option]
+            option for option in self.REQUIRED_CONFIG if not plugin_config.get(option)
         ]:
             msg = f"The following config options must be set: {', '.join(missing_config)}"
             self.unit.status = BlockedStatus(msg)
@@ -8,9 +8,14 @@ from pathlib import Path
 import pytest
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
-METADATA = yaml.safe_load(Path("./metadata.yaml").read_text())
+METADATA = yaml.load(Path("./metadata.yaml").read_text(), Loader=SafeLoader)
 APP_NAME = METADATA["name"]
 
 
@@ -5,8 +5,12 @@
 
 import unittest
 
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
 from ops.model import ActiveStatus, BlockedStatus
-from ops.testing import Harness
+from ops.testing import ExecResult, Harness
 from parameterized import parameterized  # type: ignore[import]
 
 from charm import GandiLiveDNSVersion5AcmeOperatorCharm
@@ -26,6 +30,37 @@ class TestCharm(unittest.TestCase):
         self.harness.update_config({"email": "invalid-email", "gandi_api_key": "dummy key"})
         self.assertEqual(self.harness.model.unit.status, BlockedStatus("Invalid email address"))
 
+    def test_given_lego_command_fails_when_executed_then_returns_false(self):
+        self.harness.update_config({"email": "example@email.com", "gandi_api_key": "dummy key"})
+        self.harness.set_can_connect("lego", True)
+        self.harness.handle_exec(
+            "lego", ["lego"], result=ExecResult(exit_code=1, stderr="acme: error")
+        )
+        self.assertFalse(self.harness.charm._execute_lego_cmd("dummy csr"))
+
+    def test_given_csr_with_forged_cn_bytes_in_other_attribute_when_subject_parsed_then_real_cn_returned(  # noqa: E501
+        self,
+    ):
+        csr = (
+            x509.CertificateSigningRequestBuilder()
+            .subject_name(
+                x509.Name(
+                    [
+                        x509.NameAttribute(
+                            NameOID.ORGANIZATION_NAME, "zz\x06\x03\x55\x04\x03\x13\x04evil"
+                        ),
+                        x509.NameAttribute(NameOID.COMMON_NAME, "real.example.com"),
+                    ]
+                )
+            )
+            .sign(ec.generate_private_key(ec.SECP256R1()), hashes.SHA256())
+            .public_bytes(serialization.Encoding.PEM)
+            .decode()
+        )
+        self.assertEqual(
+            GandiLiveDNSVersion5AcmeOperatorCharm._get_subject_from_csr(csr), "real.example.com"
+        )
+
     @parameterized.expand(
         [
             (